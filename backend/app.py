@@ -3,19 +3,50 @@ Main FastAPI application for DrowsyDriver
 Real-time drowsiness detection backend
 """
 
-from fastapi import FastAPI, UploadFile, File, HTTPException
+import os
+
+# One thread per FaceMesh instance, the pool below spreads work over cores
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+from fastapi import FastAPI, UploadFile, File, HTTPException, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 import cv2
 import numpy as np
 import mediapipe as mp
 from config import settings
-from utils import calculate_EAR
+from state import DetectionState
+from utils import calculate_EAR, decode_image, encode_jpeg
+import asyncio
 import base64
+import logging
+import logging.handlers
+import orjson
+import queue
+import threading
+import time
+import uuid
+
+# LOGGING
+# Records are queued and written by a background thread, so request
+# handlers never block on stdout
+
+logger = logging.getLogger("drowsy")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+log_queue = queue.Queue()
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter("%(levelname)s:     %(name)s - %(message)s"))
+log_listener = logging.handlers.QueueListener(log_queue, log_handler)
 
 # INITIALIZE FASTAPI AND MEDIAPIPE
 
 app = FastAPI(
+    default_response_class=ORJSONResponse,
     title="DrowsyDriver API",
     description="Real-time drowsiness detection",
     version="1.0.0"
@@ -26,31 +57,94 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
 # Initialize MediaPipe FaceMesh
 mp_face_mesh = mp.solutions.face_mesh
-face_mesh = mp_face_mesh.FaceMesh(
-    static_image_mode=False, 
-    max_num_faces=1,  
-    refine_landmarks=True,  
-    min_detection_confidence=0.7, 
-    min_tracking_confidence=0.7
-)
 
-# GLOBAL STATE (normally use database, but ok for demo)
+
+def create_face_mesh():
+    """
+    Create a FaceMesh instance
+    It is not thread-safe, so an instance handles one frame at a time
+    """
+    return mp_face_mesh.FaceMesh(
+        static_image_mode=False, 
+        max_num_faces=1,  
+        refine_landmarks=False,  # iris landmarks aren't needed for EAR
+        min_detection_confidence=0.7, 
+        min_tracking_confidence=0.5  # re-run full detection less often
+    )
+
+# Pool of FaceMesh instances, each fed by its own queue of (frame, future)
+# Every session is pinned to one instance so its tracking follows that session's frames
+# Filled by start_face_mesh_workers, so only the process serving the app builds it
+face_mesh_queues = []
+
+# Long-running tasks started at startup, cancelled at shutdown
+background_tasks = []
+
+@app.on_event("startup")
+async def start_logging():
+    log_listener.start()
+    logger.info(
+        "EAR threshold %s, drowsy after %ss",
+        settings.EAR_THRESHOLD, settings.DROWSY_SECONDS
+    )
+
+
+@app.on_event("shutdown")
+async def stop_logging():
+    log_listener.stop()
+
+# PER-SESSION STATE (normally use database, but ok for demo)
+
+states: dict[str, DetectionState] = {}
+states_lock = threading.Lock()
 
 
-class DetectionState:
-    def __init__(self):
-        self.closed_eye_counter = 0
-        self.alert_triggered = False
-        self.frame_count = 0
-        self.drowsy_frames = 0
+def get_state(session_id):
+    """
+    Get the detection state for a session, creating it on first use
+    """
+    with states_lock:
+        state = states.get(session_id)
+        if state is None:
+            # Pin the new session to the FaceMesh instance with the fewest sessions
+            load = [0] * len(face_mesh_queues)
+            for other in states.values():
+                load[other.worker] += 1
+            state = states[session_id] = DetectionState(load.index(min(load)))
+        state.last_seen = time.monotonic()
+        return state
+
+
+async def evict_idle_sessions():
+    """
+    Periodically drop sessions that have not been seen for SESSION_TTL seconds
+    """
+    while True:
+        await asyncio.sleep(settings.SESSION_TTL)
+        cutoff = time.monotonic() - settings.SESSION_TTL
+        with states_lock:
+            for session_id in [k for k, v in states.items() if v.last_seen < cutoff]:
+                del states[session_id]
+
+
+@app.on_event("startup")
+async def start_session_eviction():
+    background_tasks.append(asyncio.create_task(evict_idle_sessions()))
+
 
-state = DetectionState()
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    background_tasks.clear()
 
 # ENDPOINTS
 @app.get("/api/health")
@@ -66,103 +160,312 @@ async def health_check():
     }
 
 
-@app.post("/api/process-frame")
-async def process_frame(file: UploadFile = File(...)):
+def detect_landmarks(face_mesh, frame):
+    """
+    Run FaceMesh on a decoded RGB frame
+    
+    Blocking, only called from the instance's face_mesh_worker.
+    
+    Returns:
+        MediaPipe results, shape of the frame the landmarks refer to
+    """
+    # Step 2: Downscale large frames (FaceMesh works on small crops anyway)
+    h, w = frame.shape[:2]
+    scale = settings.MAX_INFERENCE_SIZE / max(h, w)
+    if scale < 1:
+        frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    
+    # Read-only input lets MediaPipe skip its own copy of the frame,
+    # made writeable again since the caller may still draw on it
+    frame.flags.writeable = False
+    try:
+        # Step 3: Detect faces
+        return face_mesh.process(frame), frame.shape
+    finally:
+        frame.flags.writeable = True
+
+
+def detect_landmarks_batch(face_mesh, frames):
+    """
+    Run FaceMesh on several frames back-to-back
+    
+    Returns:
+        list with the detect_landmarks result, or the exception raised, per frame
+    """
+    outputs = []
+    for frame in frames:
+        try:
+            outputs.append(detect_landmarks(face_mesh, frame))
+        except Exception as e:
+            outputs.append(e)
+    return outputs
+
+
+async def face_mesh_worker(face_mesh, frame_queue):
+    """
+    Feed queued frames to one FaceMesh instance
+    
+    Frames that queued up while the previous batch ran are processed
+    together in a single threadpool call.
+    """
+    while True:
+        batch = [await frame_queue.get()]
+        while not frame_queue.empty():
+            batch.append(frame_queue.get_nowait())
+        
+        try:
+            outputs = await run_in_threadpool(
+                detect_landmarks_batch, face_mesh, [frame for frame, _ in batch]
+            )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            # Fail this batch, but keep serving the sessions pinned to this instance
+            outputs = [e] * len(batch)
+        
+        for (_, future), output in zip(batch, outputs):
+            if future.cancelled():
+                continue
+            if isinstance(output, Exception):
+                future.set_exception(output)
+            else:
+                future.set_result(output)
+
+
+@app.on_event("startup")
+async def start_face_mesh_workers():
+    for _ in range(settings.FACE_MESH_POOL_SIZE):
+        frame_queue = asyncio.Queue()
+        face_mesh_queues.append(frame_queue)
+        background_tasks.append(
+            asyncio.create_task(face_mesh_worker(create_face_mesh(), frame_queue))
+        )
+
+
+async def run_detection(frame, state):
+    """
+    Run the detection pipeline on a decoded RGB frame
+    
+    Updates the given session state. The frame itself is not modified, so the
+    caller can still draw on the full resolution frame.
+    
+    Returns:
+        dict: detection results (same fields as /api/process-frame,
+              without the annotated frame or overlay)
+    """
+    state.frame_count += 1
+    
+    # Inference runs off the event loop so other requests can do I/O meanwhile
+    future = asyncio.get_running_loop().create_future()
+    face_mesh_queues[state.worker].put_nowait((frame, future))
+    results, shape = await future
+    
+    # Check if face was detected
+    # Frames without an EAR leave the drowsiness state alone: a missed detection
+    # (e.g. the head dropping) must not reset a closed-eyes episode
+    if not results.face_landmarks:
+        return {
+            "ear": None,
+            "status": "NO_FACE",
+            "message": "No face detected in frame",
+            "alert_triggered": state.alert_triggered,
+            "frame_count": state.frame_count
+        }
+    
+    # Step 4: Calculate EAR (scale-invariant, so the downscaled shape is fine)
+    ear = calculate_EAR(results.face_landmarks[0], shape)
+    
+    if ear is None:
+        return {
+            "ear": None,
+            "status": "ERROR",
+            "message": "Could not calculate EAR",
+            "alert_triggered": state.alert_triggered,
+            "frame_count": state.frame_count
+        }
+    
+    # Step 5: Check for drowsiness
+    if state.update(ear, time.monotonic()):
+        logger.warning("🚨 ALERT: DROWSINESS DETECTED!")
+    
+    return {
+        "ear": round(ear, 4),
+        "status": "DROWSY" if state.alert_triggered else "AWAKE",
+        "alert_triggered": state.alert_triggered,
+        "closed_eyes_seconds": round(state.closed_seconds(), 2),
+        "frame_count": state.frame_count,
+        "drowsy_seconds": round(state.drowsy_seconds(), 2)
+    }
+
+
+async def send_json(ws, data):
+    """
+    Send a JSON text message, serialized with orjson like the HTTP responses
+    """
+    await ws.send_text(orjson.dumps(data).decode())
+
+
+@app.websocket("/ws/frames")
+async def ws_frames(
+    ws: WebSocket,
+    session_id: str | None = None,
+    return_frame: bool = False,
+    return_overlay_only: bool = False
+):
+    """
+    WebSocket channel for processing video frames
+    
+    Query parameters (set once per connection):
+        - session_id: client session the detection state belongs to,
+          a fresh session for this connection if not given
+        - return_frame: send back the annotated frame
+        - return_overlay_only: send back the overlay text items instead,
+          so the client can draw them on its own camera feed
+    
+    Each incoming message is a binary JPG/PNG frame, anything else
+    gets the "Invalid image file" error reply.
+    For each frame the server replies with:
+        1. a JSON message with the detection results
+           (same fields as /api/process-frame, without frame_base64)
+        2. a binary message with the annotated JPEG frame,
+           only if the JSON has "has_frame": true
+    """
+    await ws.accept()
+    
+    if session_id is None:
+        session_id = uuid.uuid4().hex
+    
+    try:
+        while True:
+            message = await ws.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            
+            # Looked up per frame so a reset or eviction starts a fresh state
+            state = get_state(session_id)
+            
+            # Text messages have no "bytes"
+            data = message.get("bytes")
+            frame = None
+            if data:
+                try:
+                    frame = await run_in_threadpool(decode_image, data)
+                except Exception:
+                    logger.exception("Error decoding frame")
+            
+            if frame is None or frame.size == 0:
+                await send_json(ws, {
+                    "ear": None,
+                    "status": "ERROR",
+                    "message": "Invalid image file",
+                    "alert_triggered": False,
+                    "frame_count": state.frame_count,
+                    "has_frame": False
+                })
+                continue
+            
+            try:
+                result = await run_detection(frame, state)
+            except Exception as e:
+                logger.exception("Error processing frame")
+                await send_json(ws, {
+                    "ear": None,
+                    "status": "ERROR",
+                    "message": str(e),
+                    "alert_triggered": False,
+                    "frame_count": state.frame_count,
+                    "has_frame": False
+                })
+                continue
+            
+            has_ear = result["ear"] is not None
+            
+            if has_ear and return_overlay_only:
+                result["overlay"] = build_overlay(result["ear"], state)
+            
+            annotated = has_ear and return_frame and not return_overlay_only
+            result["has_frame"] = annotated
+            await send_json(ws, result)
+            
+            if annotated:
+                draw_visualization(frame, result["ear"], state)
+                await ws.send_bytes(await run_in_threadpool(encode_jpeg, frame))
+    
+    except WebSocketDisconnect:
+        pass
+
+
+@app.post("/api/process-frame", deprecated=True)
+async def process_frame(
+    file: UploadFile = File(...),
+    session_id: str = Query(...),
+    return_frame: bool = False,
+    return_overlay_only: bool = False
+):
     """
     Main endpoint for processing video frames
     
+    Deprecated: use the /ws/frames WebSocket instead, which avoids
+    the per-frame HTTP request and base64 encoding.
+    
     Input:
         - file: JPG/PNG image file
+        - session_id: client session the detection state belongs to
+        - return_frame: include the annotated frame as frame_base64
+        - return_overlay_only: include the overlay text items as "overlay"
+          instead, so the client can draw them on its own camera feed
     
     Output:
         {
             "ear": 0.35,
             "status": "AWAKE",
             "alert_triggered": false,
-            "closed_eyes_frames": 0,
+            "closed_eyes_seconds": 0.0,
             "frame_count": 100,
-            "drowsy_frames": 5
+            "drowsy_seconds": 0.5
         }
     """
     
+    state = get_state(session_id)
+    
     try:
-        state.frame_count += 1
+        # Step 1: Read the uploaded file, never more than MAX_UPLOAD_BYTES
+        if file.size is not None and file.size > settings.MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="Image file too large")
+        
+        contents = await file.read(settings.MAX_UPLOAD_BYTES + 1)
+        if len(contents) > settings.MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="Image file too large")
         
-        # Step 1: Read the uploaded file
-        contents = await file.read()
-        nparr = np.frombuffer(contents, np.uint8)
-        frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        frame = await run_in_threadpool(decode_image, contents)
         
         # Validate frame
         if frame is None or frame.size == 0:
             raise HTTPException(status_code=400, detail="Invalid image file")
         
-        # Step 2: Convert BGR to RGB (MediaPipe needs RGB)
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Step 3: Detect faces
-        results = face_mesh.process(frame_rgb)
-        
-        # Check if face was detected
-        if not results.face_landmarks:
-            return {
-                "ear": None,
-                "status": "NO_FACE",
-                "message": "No face detected in frame",
-                "alert_triggered": False,
-                "frame_count": state.frame_count
-            }
-        
-        # Step 4: Calculate EAR
-        ear = calculate_EAR(results.face_landmarks[0], frame.shape)
+        result = await run_detection(frame, state)
+        if result["ear"] is None:
+            return result
         
-        if ear is None:
-            return {
-                "ear": None,
-                "status": "ERROR",
-                "message": "Could not calculate EAR",
-                "alert_triggered": False,
-                "frame_count": state.frame_count
-            }
-        
-        # Step 5: Check for drowsiness
-        if ear < settings.EAR_THRESHOLD:
-            # Eyes are closed
-            state.closed_eye_counter += 1
+        if return_overlay_only:
+            result["overlay"] = build_overlay(result["ear"], state)
+        elif return_frame:
+            # Step 6: Draw visualization
+            draw_visualization(frame, result["ear"], state)
             
-            if state.closed_eye_counter >= settings.CONSECUTIVE_FRAMES:
-                # Eyes have been closed for long enough
-                state.drowsy_frames += 1
-                
-                if not state.alert_triggered:
-                    # First time triggering alert
-                    state.alert_triggered = True
-                    print("🚨 ALERT: DROWSINESS DETECTED!")
-        else:
-            # Eyes are open
-            state.closed_eye_counter = 0
-            state.alert_triggered = False
-        
-        # Step 6: Draw visualization
-        frame = draw_visualization(frame, ear, state)
-        
-        # Step 7: Encode frame to base64 for sending to frontend
-        _, buffer = cv2.imencode('.jpg', frame)
-        frame_base64 = base64.b64encode(buffer).decode()
+            # Step 7: Encode frame to base64 for sending to frontend
+            buffer = await run_in_threadpool(encode_jpeg, frame)
+            result["frame_base64"] = base64.b64encode(buffer).decode()  # Send back annotated frame
         
         # Step 8: Return results
-        return {
-            "ear": round(ear, 4),
-            "status": "DROWSY" if state.alert_triggered else "AWAKE",
-            "alert_triggered": state.alert_triggered,
-            "closed_eyes_frames": state.closed_eye_counter,
-            "frame_count": state.frame_count,
-            "drowsy_frames": state.drowsy_frames,
-            "frame_base64": frame_base64  # Send back annotated frame
-        }
+        return result
     
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Error processing frame: {e}")
+        logger.exception("Error processing frame")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -173,7 +476,7 @@ async def get_config():
     """
     return {
         "ear_threshold": settings.EAR_THRESHOLD,
-        "consecutive_frames": settings.CONSECUTIVE_FRAMES,
+        "drowsy_seconds": settings.DROWSY_SECONDS,
         "window_size": settings.WINDOW_SIZE
     }
 
@@ -182,12 +485,21 @@ async def get_config():
 async def update_config(config: dict):
     """
     Update configuration
+    
+    Only allowed with a single worker: settings live in each process,
+    so a change would only reach the worker that received the request.
     """
+    if settings.WORKERS > 1:
+        raise HTTPException(
+            status_code=409,
+            detail="Config can't be changed at runtime with multiple workers, edit config.py instead"
+        )
+    
     if "ear_threshold" in config:
         settings.EAR_THRESHOLD = float(config["ear_threshold"])
     
-    if "consecutive_frames" in config:
-        settings.CONSECUTIVE_FRAMES = int(config["consecutive_frames"])
+    if "drowsy_seconds" in config:
+        settings.DROWSY_SECONDS = float(config["drowsy_seconds"])
     
     if "window_size" in config:
         settings.WINDOW_SIZE = int(config["window_size"])
@@ -196,62 +508,130 @@ async def update_config(config: dict):
         "status": "updated",
         "new_config": {
             "ear_threshold": settings.EAR_THRESHOLD,
-            "consecutive_frames": settings.CONSECUTIVE_FRAMES,
+            "drowsy_seconds": settings.DROWSY_SECONDS,
             "window_size": settings.WINDOW_SIZE
         }
     }
 
 
 @app.get("/api/stats")
-async def get_stats():
+async def get_stats(session_id: str = Query(...)):
     """
     Get detection statistics
     """
+    # Looking at stats shouldn't create (or keep alive) a session
+    with states_lock:
+        state = states.get(session_id)
+    
+    if state is None:
+        return {
+            "frames_processed": 0,
+            "drowsy_seconds": 0.0,
+            "drowsy_percentage": 0
+        }
+    
+    drowsy_seconds = state.drowsy_seconds()
     drowsy_percentage = (
-        (state.drowsy_frames / max(state.frame_count, 1)) * 100
-    ) if state.frame_count > 0 else 0
+        (drowsy_seconds / state.active_time) * 100
+    ) if state.active_time > 0 else 0
     
     return {
         "frames_processed": state.frame_count,
-        "drowsy_frames": state.drowsy_frames,
+        "drowsy_seconds": round(drowsy_seconds, 2),
         "drowsy_percentage": round(drowsy_percentage, 2)
     }
 
 
 @app.post("/api/reset")
-async def reset_stats():
+async def reset_stats(session_id: str = Query(...)):
     """
     Reset statistics counter
     """
-    state.frame_count = 0
-    state.drowsy_frames = 0
-    state.closed_eye_counter = 0
-    state.alert_triggered = False
+    with states_lock:
+        states.pop(session_id, None)
     
     return {"status": "reset"}
 
 
-# HELPER FUNCTION: DRAW VISUALIZATION
+# HELPER FUNCTIONS: VISUALIZATION
 
-def draw_visualization(frame, ear, state):
-    """
-    Draw status information on the frame
+def build_overlay(ear, state):
     """
-    h, w = frame.shape[:2]
+    Build the status text items shown on top of the frame
     
+    Returns:
+        list of dicts with "text", "position" (x, y baseline in pixels),
+        "scale", "color" (RGB) and "thickness"
+    """
     # Determine color based on status
     status = "DROWSY!" if state.alert_triggered else "AWAKE"
-    color = (0, 0, 255) if state.alert_triggered else (0, 255, 0)  # Red or Green
+    color = (255, 0, 0) if state.alert_triggered else (0, 255, 0)  # Red or Green
     
-    # Draw text on frame
-    cv2.putText(frame, f"EAR: {ear:.3f}", (10, 30), 
-                cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+    return [
+        {"text": f"EAR: {ear:.3f}", "position": (10, 30),
+         "scale": 0.8, "color": (255, 255, 255), "thickness": 2},
+        {"text": status, "position": (10, 80),
+         "scale": 1.2, "color": color, "thickness": 3},
+        {"text": f"Closed: {state.closed_seconds():.1f}/{settings.DROWSY_SECONDS:.1f}s",
+         "position": (10, 130), "scale": 0.7, "color": (255, 255, 255), "thickness": 2},
+    ]
+
+
+# Pre-rendered text strips keyed by (text, scale, color, thickness)
+# Only a few thousand distinct strings are possible, cleared if it ever grows past that
+text_cache = {}
+TEXT_CACHE_SIZE = 4096
+
+
+def render_text(text, scale, color, thickness):
+    """
+    Render text once onto a small black strip
+    
+    Returns:
+        strip: RGB image with the text
+        mask: boolean mask of the text pixels
+        offset: (dx, dy) from the putText baseline origin to the strip's top-left
+    """
+    key = (text, scale, color, thickness)
+    cached = text_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    (tw, th), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)
+    pad = thickness
+    strip = np.zeros((th + baseline + 2 * pad, tw + 2 * pad, 3), dtype=np.uint8)
+    # No anti-aliasing, so the mask covers exactly the pixels putText would draw
+    cv2.putText(strip, text, (pad, pad + th), cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness,
+                cv2.LINE_8)
     
-    cv2.putText(frame, status, (10, 80), 
-                cv2.FONT_HERSHEY_SIMPLEX, 1.2, color, 3)
+    if len(text_cache) >= TEXT_CACHE_SIZE:
+        text_cache.clear()
+    cached = text_cache[key] = (strip, strip.any(axis=2), (-pad, -pad - th))
+    return cached
+
+
+def draw_visualization(frame, ear, state):
+    """
+    Draw status information on the frame
+    """
+    h, w = frame.shape[:2]
     
-    cv2.putText(frame, f"Closed: {state.closed_eye_counter}/{settings.CONSECUTIVE_FRAMES}", 
-                (10, 130), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+    for item in build_overlay(ear, state):
+        # Frames are RGB, same as the overlay colors
+        strip, mask, (dx, dy) = render_text(
+            item["text"], item["scale"], item["color"], item["thickness"]
+        )
+        
+        # Paste the strip's text pixels, clipped to the frame
+        x, y = item["position"][0] + dx, item["position"][1] + dy
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + strip.shape[1], w), min(y + strip.shape[0], h)
+        if x0 >= x1 or y0 >= y1:
+            continue
+        
+        roi = frame[y0:y1, x0:x1]
+        sub = (slice(y0 - y, y1 - y), slice(x0 - x, x1 - x))
+        np.copyto(roi, strip[sub], where=mask[sub][..., None])
     
     return frame
 
@@ -259,18 +639,17 @@ def draw_visualization(frame, ear, state):
 if __name__ == "__main__":
     import uvicorn
     
-    print("\n" + "="*60)
-    print(" DrowsyDriver Backend Starting...")
-    print("="*60)
-    print(f"API running at http://{settings.API_HOST}:{settings.API_PORT}")
-    print(f"Docs at http://localhost:8000/docs")
-    print(f"EAR Threshold: {settings.EAR_THRESHOLD}")
-    print(f"Consecutive Frames: {settings.CONSECUTIVE_FRAMES}")
-    print("="*60 + "\n")
-    
+    # Import string so uvicorn can reload or start several worker processes
+    # Note: session state and settings are per process, so with several workers
+    # a client needs sticky routing (or the state needs to move to e.g. Redis),
+    # and POST /api/config is rejected
     uvicorn.run(
-        app,
+        "app:app",
         host=settings.API_HOST,
         port=settings.API_PORT,
+        loop="auto",  # uvloop when installed (not available on Windows)
+        http="httptools",
+        workers=settings.WORKERS,
+        ws_max_size=settings.MAX_UPLOAD_BYTES,
         reload=settings.DEBUG
     )
\ No newline at end of file
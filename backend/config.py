@@ -3,18 +3,31 @@ Configuration file for the backend
 All settings are defined here for easy modification
 """
 
+import os
+
 class Settings:
     # Detection parameters
     EAR_THRESHOLD = 0.25  
-    CONSECUTIVE_FRAMES = 20 
+    DROWSY_SECONDS = 2.0  # eyes closed for this long triggers the alert
+    MAX_FRAME_GAP = 1.0  # longer gaps (s) between frames end the closed-eyes episode
     WINDOW_SIZE = 10 
+    MAX_INFERENCE_SIZE = 480  # longest side (px) of the frame passed to FaceMesh
+    JPEG_QUALITY = 70  # quality of the annotated frames sent back
+    MAX_UPLOAD_BYTES = 5 * 1024 * 1024  # larger frames are rejected
+    
+    # Sessions idle for longer than this (seconds) are dropped
+    SESSION_TTL = 300
     
     # API settings
     API_HOST = "0.0.0.0"  
     API_PORT = 8000
     DEBUG = True  
+    WORKERS = 1 if DEBUG else (os.cpu_count() or 4)  # uvicorn processes
+    
+    # Number of FaceMesh instances running in parallel in each worker
+    FACE_MESH_POOL_SIZE = max((os.cpu_count() or 4) // WORKERS, 1)
     
-    # CORS settings 
-    CORS_ORIGINS = ["*"] 
+    # CORS settings (frontend origins, a wildcard prevents preflight caching in some browsers)
+    CORS_ORIGINS = ["http://localhost:3000", "http://127.0.0.1:3000"]
 
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Per-session drowsiness state
+Kept free of MediaPipe/OpenCV so the state machine can be tested on its own
+"""
+
+import time
+
+from config import settings
+
+
+class DetectionState:
+    """
+    Drowsiness state of one session
+    
+    Times are time.monotonic() values of frames that had an EAR, so the
+    result doesn't depend on the client's frame rate. Frames without an EAR
+    (no face, EAR error) leave the state alone; only a gap of more than
+    MAX_FRAME_GAP between EAR frames (paused, stalled) ends an episode.
+    """
+    def __init__(self, worker):
+        self.eyes_closed_since = None
+        self.alert_triggered = False
+        self.frame_count = 0
+        self.last_ear_at = None  # time of the last frame with an EAR
+        self.active_time = 0.0  # seconds covered by frames with an EAR
+        self.drowsy_time = 0.0  # drowsy seconds of finished episodes
+        self.last_seen = time.monotonic()
+        # Index of the FaceMesh instance handling this session
+        self.worker = worker
+    
+    def closed_seconds(self):
+        """
+        How long the eyes have been closed, 0 if they are open
+        """
+        if self.eyes_closed_since is None:
+            return 0.0
+        return self.last_ear_at - self.eyes_closed_since
+    
+    def drowsy_seconds(self):
+        """
+        Total time spent drowsy, including the current episode
+        """
+        return self.drowsy_time + max(self.closed_seconds() - settings.DROWSY_SECONDS, 0.0)
+    
+    def end_episode(self):
+        """
+        Close the current closed-eyes episode at the last frame with an EAR
+        """
+        if self.eyes_closed_since is not None:
+            self.drowsy_time = self.drowsy_seconds()
+            self.eyes_closed_since = None
+            self.alert_triggered = False
+        self.last_ear_at = None
+    
+    def update(self, ear, now):
+        """
+        Record a frame with an EAR taken at time `now`
+        
+        Returns:
+            bool: True if this frame triggered the alert
+        """
+        if self.last_ear_at is not None and now - self.last_ear_at > settings.MAX_FRAME_GAP:
+            # Paused or stalled, the gap doesn't count as eyes closed
+            self.end_episode()
+        elif self.last_ear_at is not None:
+            self.active_time += now - self.last_ear_at
+        self.last_ear_at = now
+        
+        if ear < settings.EAR_THRESHOLD:
+            # Eyes are closed
+            if self.eyes_closed_since is None:
+                self.eyes_closed_since = now
+            
+            if not self.alert_triggered and self.closed_seconds() >= settings.DROWSY_SECONDS:
+                # Eyes have been closed for long enough
+                self.alert_triggered = True
+                return True
+        elif self.eyes_closed_since is not None:
+            # Eyes just opened
+            self.drowsy_time = self.drowsy_seconds()
+            self.eyes_closed_since = None
+            self.alert_triggered = False
+        
+        return False
@@ -0,0 +1,77 @@
+"""
+Tests for the per-session drowsiness state machine
+Run from backend/: python -m pytest
+"""
+
+from config import settings
+from state import DetectionState
+
+OPEN = settings.EAR_THRESHOLD + 0.1
+CLOSED = settings.EAR_THRESHOLD - 0.1
+FRAME = 0.1  # 10 FPS, what the frontend sends
+
+
+def run(state, ears, start=0.0):
+    """
+    Feed EAR values at 10 FPS, None stands for a frame without an EAR
+    
+    Returns:
+        float: time of the next frame
+    """
+    now = start
+    for ear in ears:
+        if ear is not None:
+            state.update(ear, now)
+        now += FRAME
+    return now
+
+
+def test_alert_after_drowsy_seconds_of_closed_eyes():
+    state = DetectionState(worker=0)
+    frames = int(settings.DROWSY_SECONDS / FRAME)
+    
+    run(state, [CLOSED] * frames)
+    assert not state.alert_triggered
+    
+    run(state, [CLOSED] * 2, start=frames * FRAME)
+    assert state.alert_triggered
+
+
+def test_opening_eyes_ends_episode():
+    state = DetectionState(worker=0)
+    now = run(state, [CLOSED] * 31)
+    run(state, [OPEN], start=now)
+    
+    assert not state.alert_triggered
+    assert state.closed_seconds() == 0.0
+    assert round(state.drowsy_seconds(), 6) == round(3.1 - settings.DROWSY_SECONDS, 6)
+
+
+def test_missed_detections_keep_closed_eyes_episode():
+    # A NO_FACE frame every 1.5 s while the eyes stay closed for 5 s
+    ears = [None if i % 15 == 14 else CLOSED for i in range(50)]
+    state = DetectionState(worker=0)
+    run(state, ears)
+    
+    assert state.alert_triggered
+    assert state.drowsy_seconds() > 0
+
+
+def test_long_gap_does_not_count_as_closed_eyes():
+    state = DetectionState(worker=0)
+    now = run(state, [CLOSED] * 5)
+    
+    # Paused for a minute with the eyes last seen closed
+    run(state, [CLOSED], start=now + 60)
+    
+    assert not state.alert_triggered
+    assert state.closed_seconds() == 0.0
+    assert state.drowsy_seconds() == 0.0
+
+
+def test_active_time_excludes_gaps():
+    state = DetectionState(worker=0)
+    now = run(state, [OPEN] * 11)
+    run(state, [OPEN] * 11, start=now + 60)
+    
+    assert round(state.active_time, 6) == 2.0
@@ -1,30 +1,72 @@
 """
 Utility functions for drowsiness detection
-Eye Aspect Ratio (EAR) calculation
+Eye Aspect Ratio (EAR) calculation and image encoding/decoding
 """
 
+import logging
 import math
 
+import cv2
+import numpy as np
+from numba import njit
+
+from config import settings
+
+# libjpeg-turbo for JPEG decode/encode, falls back to OpenCV if it isn't installed
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    jpeg = TurboJPEG()
+except (ImportError, RuntimeError):
+    jpeg = None
+
+logger = logging.getLogger("drowsy")
+
 # These are the indices of eye landmarks from MediaPipe
 LEFT_EYE = [33, 160, 158, 133, 153, 144]
 RIGHT_EYE = [263, 387, 385, 362, 380, 373]
 
+# Both eyes in one array so landmarks can be gathered in a single pass
+EYE_IDX = np.array(LEFT_EYE + RIGHT_EYE, dtype=np.int32)
+
+# Same indices as (position, landmark index) ints for indexing protobuf landmarks,
+# iterating the array directly would box every element into a NumPy scalar
+_EYE_IDX_ITEMS = tuple(enumerate(EYE_IDX.tolist()))
+
+# Reused (x, y) buffer for the 12 eye landmarks
+# Not thread-safe: calculate_EAR is only called from the event loop
+_coords = np.empty((12, 2), dtype=np.float32)
 
-def euclidean_distance(p1, p2):
+
+@njit(cache=True, fastmath=True)
+def _distance(p1, p2, aspect):
     """
-    Calculate straight-line distance between two points
-    
-    Args:
-        p1: (x1, y1) - first point
-        p2: (x2, y2) - second point
-    
-    Returns:
-        float: distance between points
+    Distance between two normalized (x, y) points, in units of frame height
+    """
+    dx = (p1[0] - p2[0]) * aspect
+    dy = p1[1] - p2[1]
+    return math.sqrt(dx * dx + dy * dy)
+
+
+@njit(cache=True, fastmath=True)
+def _ear_kernel(coords, aspect):
+    """
+    Average EAR of both eyes from the (12, 2) normalized eye landmarks
     
-    Example:
-        distance((0, 0), (3, 4)) returns 5.0
+    EAR is a ratio, so scaling both axes by the frame height cancels out and
+    only the width/height aspect is needed to get pixel-proportional distances
     """
-    return math.sqrt((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2)
+    total = 0.0
+    for start in range(0, 12, 6):
+        eye = coords[start:start + 6]
+        vertical1 = _distance(eye[1], eye[5], aspect)
+        vertical2 = _distance(eye[2], eye[4], aspect)
+        horizontal = _distance(eye[0], eye[3], aspect)
+        total += (vertical1 + vertical2) / (2.0 * horizontal)
+    return total / 2.0
+
+
+# Compile once at import so the first frame doesn't pay for the JIT
+_ear_kernel(np.arange(24, dtype=np.float32).reshape(12, 2), 1.0)
 
 
 def calculate_EAR(landmarks, frame_shape):
@@ -51,34 +93,83 @@ def calculate_EAR(landmarks, frame_shape):
         if landmarks is None:
             return None
         
-        # Convert landmark coordinates from normalized (0-1) to pixel values
-        points = []
-        for idx in LEFT_EYE + RIGHT_EYE:  
-            lm = landmarks.landmark[idx] 
-            x = int(lm.x * w)  
-            y = int(lm.y * h)  
-            points.append((x, y))
-        
-        # Split into left and right eyes
-        left_eye = points[:6]  
-        right_eye = points[6:]  
-        
-        # Calculate EAR for one eye
-        def calculate_eye_ear(eye):
-            vertical1 = euclidean_distance(eye[1], eye[5])  
-            vertical2 = euclidean_distance(eye[2], eye[4])  
-            horizontal = euclidean_distance(eye[0], eye[3])  
-            
-            # Apply formula
-            ear = (vertical1 + vertical2) / (2.0 * horizontal)
-            return ear
+        # Copy the normalized (0-1) float coordinates of the 12 eye landmarks
+        # (no rounding to whole pixels, which would skew EAR near the threshold)
+        for i, idx in _EYE_IDX_ITEMS:
+            lm = landmarks.landmark[idx]
+            _coords[i, 0] = lm.x
+            _coords[i, 1] = lm.y
         
-        # Calculate for both eyes and average them
-        left_ear = calculate_eye_ear(left_eye)
-        right_ear = calculate_eye_ear(right_eye)
-        
-        return (left_ear + right_ear) / 2.0
+        return _ear_kernel(_coords, w / h)
+    
+    except Exception:
+        logger.exception("Error calculating EAR")
+        return None
+
+
+def _exif_orientation(data):
+    """
+    Read the EXIF orientation tag of JPEG bytes
+    
+    Returns:
+        int: orientation (1-8), 1 (upright) if there is no tag
+    """
+    if data[:2] != b"\xff\xd8":
+        return 1
+    
+    # Walk the JPEG segments up to the image data, looking for the Exif APP1
+    pos = 2
+    while pos + 4 <= len(data) and data[pos] == 0xFF:
+        marker = data[pos + 1]
+        if marker in (0xD9, 0xDA):  # end of image / start of scan
+            break
+        length = int.from_bytes(data[pos + 2:pos + 4], "big")
+        if marker == 0xE1 and data[pos + 4:pos + 10] == b"Exif\0\0":
+            tiff = data[pos + 10:pos + 2 + length]
+            order = "little" if tiff[:2] == b"II" else "big"
+            ifd = int.from_bytes(tiff[4:8], order)
+            count = int.from_bytes(tiff[ifd:ifd + 2], order)
+            for entry in range(ifd + 2, ifd + 2 + 12 * count, 12):
+                if int.from_bytes(tiff[entry:entry + 2], order) == 0x0112:
+                    return int.from_bytes(tiff[entry + 8:entry + 10], order) or 1
+            return 1
+        pos += 2 + length
+    
+    return 1
+
+
+def decode_image(data):
+    """
+    Decode JPG/PNG bytes into an RGB frame (what MediaPipe needs)
+    
+    Returns:
+        numpy array (h, w, 3), or None if the data is not a valid image
+    """
+    # turbojpeg ignores EXIF orientation, OpenCV applies it
+    if jpeg is not None and _exif_orientation(data) == 1:
+        try:
+            return jpeg.decode(data, pixel_format=TJPF_RGB)
+        except (OSError, ValueError):
+            pass  # Not a JPEG, let OpenCV try
+    
+    try:
+        frame = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+    except cv2.error:
+        return None  # e.g. empty data
+    
+    if frame is not None:
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+    return frame
+
+
+def encode_jpeg(frame):
+    """
+    Encode an RGB frame as JPEG bytes with settings.JPEG_QUALITY
+    """
+    if jpeg is not None:
+        return jpeg.encode(frame, quality=settings.JPEG_QUALITY, pixel_format=TJPF_RGB)
     
-    except Exception as e:
-        print(f"Error calculating EAR: {e}")
-        return None
\ No newline at end of file
+    # OpenCV only encodes BGR
+    frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+    _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, settings.JPEG_QUALITY])
+    return buffer.tobytes()
@@ -16,9 +16,13 @@ export default function Home() {
   const [config, setConfig] = useState<Config | null>(null);
   const [isBackendConnected, setIsBackendConnected] = useState(false);
   const [processedFrame, setProcessedFrame] = useState<string | null>(null);
+  const [connectionError, setConnectionError] = useState<string | null>(null);
   
   // Refs for cleanup
   const intervalRef = useRef<NodeJS.Timeout | null>(null);
+  const socketRef = useRef<WebSocket | null>(null);
+  // True while a frame is sent and its result hasn't come back yet
+  const frameInFlightRef = useRef(false);
   const audioRef = useRef<HTMLAudioElement | null>(null);
 
   // Check backend connection on mount
@@ -76,6 +80,16 @@ export default function Home() {
     
     try {
       await startWebcam();
+      setConnectionError(null);
+      frameInFlightRef.current = false;
+      
+      const socket = api.openFrameSocket(handleResult, handleFrame, () => {
+        // Only react if this socket wasn't closed by handleStop
+        if (socketRef.current === socket) {
+          handleConnectionLost();
+        }
+      });
+      socketRef.current = socket;
       setIsRunning(true);
       
       // Start sending frames every 100ms (10 FPS)
@@ -98,39 +112,71 @@ export default function Home() {
     if (intervalRef.current) {
       clearInterval(intervalRef.current);
     }
+    
+    const socket = socketRef.current;
+    socketRef.current = null;
+    socket?.close();
+  }
+
+  /**
+   * Stop detection when the frame socket drops unexpectedly
+   */
+  function handleConnectionLost() {
+    handleStop();
+    setConnectionError('Lost connection to the backend. Press Start to reconnect.');
   }
 
   /**
    * Capture frame and send to backend
    */
   async function processAndSendFrame() {
-    const frameDataUrl = captureFrame();
-    if (!frameDataUrl) return;
+    const socket = socketRef.current;
+    if (!socket || socket.readyState !== WebSocket.OPEN) return;
+    
+    // Skip this tick if the backend is still busy with the previous frame,
+    // otherwise frames pile up and results lag further behind the camera
+    if (frameInFlightRef.current) return;
+    frameInFlightRef.current = true;
     
     try {
-      // Convert data URL to Blob
-      const blob = await fetch(frameDataUrl).then(r => r.blob());
-      
-      // Send to backend
-      const result = await api.processFrame(blob);
-      
-      setDetectionData(result);
-      
-      // If there's an annotated frame, display it
-      if (result.frame_base64) {
-        setProcessedFrame(`data:image/jpeg;base64,${result.frame_base64}`);
+      const blob = await captureFrame();
+      if (!blob || socket.readyState !== WebSocket.OPEN) {
+        frameInFlightRef.current = false;
+        return;
       }
       
-      // If drowsy alert, play sound
-      if (result.alert_triggered && !audioRef.current?.paused) {
-        playAlert();
-      }
+      // Send to backend as a binary message
+      socket.send(blob);
       
     } catch (err) {
+      frameInFlightRef.current = false;
       console.error('Frame processing error:', err);
     }
   }
 
+  /**
+   * Handle detection result from backend
+   */
+  function handleResult(result: DetectionResult) {
+    frameInFlightRef.current = false;
+    setDetectionData(result);
+    
+    // If drowsy alert, play sound
+    if (result.alert_triggered && !audioRef.current?.paused) {
+      playAlert();
+    }
+  }
+
+  /**
+   * Display annotated frame from backend
+   */
+  function handleFrame(frame: Blob) {
+    setProcessedFrame(prev => {
+      if (prev) URL.revokeObjectURL(prev);
+      return URL.createObjectURL(frame);
+    });
+  }
+
   /**
    * Play alert sound
    */
@@ -217,6 +263,11 @@ export default function Home() {
                   ⚠️ {webcamError}
                 </div>
               )}
+              {connectionError && (
+                <div className="mb-4 p-3 bg-red-900 border border-red-500 text-red-200 rounded">
+                  ⚠️ {connectionError}
+                </div>
+              )}
 
               {/* Control Buttons */}
               <div className="flex gap-3">
@@ -291,15 +342,15 @@ export default function Home() {
 
             {/* Eyes Closed Counter */}
             <div className="bg-slate-700 rounded-lg p-6 shadow-2xl">
-              <h3 className="text-sm text-gray-400 mb-2 uppercase tracking-wider">Eyes Closed Frames</h3>
+              <h3 className="text-sm text-gray-400 mb-2 uppercase tracking-wider">Eyes Closed Time</h3>
               <div className="text-3xl font-bold text-yellow-400">
-                {detectionData?.closed_eyes_frames || 0} / {config?.consecutive_frames || 20}
+                {(detectionData?.closed_eyes_seconds || 0).toFixed(1)}s / {(config?.drowsy_seconds || 2).toFixed(1)}s
               </div>
               <div className="w-full bg-slate-600 rounded-full h-2 mt-3">
                 <div
                   className="bg-yellow-500 h-2 rounded-full transition-all"
                   style={{
-                    width: `${Math.min(((detectionData?.closed_eyes_frames || 0) / (config?.consecutive_frames || 20)) * 100, 100)}%`
+                    width: `${Math.min(((detectionData?.closed_eyes_seconds || 0) / (config?.drowsy_seconds || 2)) * 100, 100)}%`
                   }}
                 />
               </div>
@@ -315,8 +366,8 @@ export default function Home() {
                     <span className="font-bold text-white">{stats.frames_processed}</span>
                   </div>
                   <div className="flex justify-between">
-                    <span className="text-gray-300">Drowsy Frames:</span>
-                    <span className="font-bold text-red-400">{stats.drowsy_frames}</span>
+                    <span className="text-gray-300">Drowsy Time:</span>
+                    <span className="font-bold text-red-400">{stats.drowsy_seconds.toFixed(1)}s</span>
                   </div>
                   <div className="flex justify-between">
                     <span className="text-gray-300">Drowsy %:</span>
@@ -342,8 +393,8 @@ export default function Home() {
                     <span className="float-right font-mono text-white">{config.ear_threshold}</span>
                   </p>
                   <p className="text-gray-300">
-                    <span className="text-gray-400">Consecutive:</span>
-                    <span className="float-right font-mono text-white">{config.consecutive_frames}</span>
+                    <span className="text-gray-400">Drowsy After:</span>
+                    <span className="float-right font-mono text-white">{config.drowsy_seconds}s</span>
                   </p>
                   <p className="text-gray-300">
                     <span className="text-gray-400">Window Size:</span>
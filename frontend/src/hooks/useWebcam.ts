@@ -58,21 +58,22 @@ export const useWebcam = () => {
   /**
    * Capture current video frame
    */
-  const captureFrame = useCallback(() => {
-    if (!videoRef.current || !canvasRef.current) {
-      return null;
+  const captureFrame = useCallback((): Promise<Blob | null> => {
+    const canvas = canvasRef.current;
+    if (!videoRef.current || !canvas) {
+      return Promise.resolve(null);
     }
     
-    const ctx = canvasRef.current.getContext('2d');
+    const ctx = canvas.getContext('2d');
     if (!ctx) {
-      return null;
+      return Promise.resolve(null);
     }
     
     // Draw current video frame onto canvas
     ctx.drawImage(videoRef.current, 0, 0, 640, 480);
     
-    // Return as data URL (like "data:image/jpeg;base64,...")
-    return canvasRef.current.toDataURL('image/jpeg');
+    // Return as a binary JPEG Blob (no base64 data URL)
+    return new Promise(resolve => canvas.toBlob(resolve, 'image/jpeg'));
   }, []);
 
   // Cleanup when component unmounts
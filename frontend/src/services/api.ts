@@ -3,18 +3,56 @@
  * All backend API calls happen through this file
  */
 
+import { DetectionResult } from '@/types';
+
 const API_BASE = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
+const WS_BASE = API_BASE.replace(/^http/, 'ws');
+
+// Identifies this browser tab so the backend keeps separate detection state
+const SESSION_ID = crypto.randomUUID();
 
 export const api = {
+  /**
+   * Open a WebSocket for streaming frames to the backend
+   * Send frames with socket.send(blob); every frame gets a JSON result,
+   * followed by the annotated JPEG as a Blob when result.has_frame is true
+   * onClose is called when the connection drops or fails to open
+   */
+  openFrameSocket(
+    onResult: (result: DetectionResult) => void,
+    onFrame: (frame: Blob) => void,
+    onClose: (event: CloseEvent) => void
+  ) {
+    const socket = new WebSocket(`${WS_BASE}/ws/frames?session_id=${SESSION_ID}&return_frame=true`);
+    socket.binaryType = 'blob';
+
+    socket.onmessage = (event) => {
+      if (typeof event.data === 'string') {
+        onResult(JSON.parse(event.data));
+      } else {
+        onFrame(event.data);
+      }
+    };
+
+    socket.onerror = (event) => {
+      console.error('Frame socket error:', event);
+    };
+
+    socket.onclose = onClose;
+
+    return socket;
+  },
+
   /**
    * Send a video frame to backend for analysis
+   * Deprecated: use openFrameSocket instead
    */
   async processFrame(file: Blob) {
     const formData = new FormData();
     formData.append('file', file);
     
     const response = await fetch(
-      `${API_BASE}/api/process-frame`,
+      `${API_BASE}/api/process-frame?session_id=${SESSION_ID}`,
       {
         method: 'POST',
         body: formData
@@ -63,7 +101,7 @@ export const api = {
    * Get detection statistics
    */
   async getStats() {
-    const response = await fetch(`${API_BASE}/api/stats`);
+    const response = await fetch(`${API_BASE}/api/stats?session_id=${SESSION_ID}`);
     return response.json();
   },
 
@@ -72,7 +110,7 @@ export const api = {
    */
   async resetStats() {
     const response = await fetch(
-      `${API_BASE}/api/reset`,
+      `${API_BASE}/api/reset?session_id=${SESSION_ID}`,
       { method: 'POST' }
     );
     return response.json();
@@ -7,21 +7,31 @@ export interface DetectionResult {
   ear: number | null;
   status: 'AWAKE' | 'DROWSY' | 'NO_FACE' | 'ERROR';
   alert_triggered: boolean;
-  closed_eyes_frames: number;
+  closed_eyes_seconds: number;
   frame_count: number;
-  drowsy_frames: number;
+  drowsy_seconds: number;
   frame_base64?: string;
+  has_frame?: boolean;
+  overlay?: OverlayItem[];
   message?: string;
 }
 
+export interface OverlayItem {
+  text: string;
+  position: [number, number];
+  scale: number;
+  color: [number, number, number];
+  thickness: number;
+}
+
 export interface Config {
   ear_threshold: number;
-  consecutive_frames: number;
+  drowsy_seconds: number;
   window_size: number;
 }
 
 export interface Stats {
   frames_processed: number;
-  drowsy_frames: number;
+  drowsy_seconds: number;
   drowsy_percentage: number;
 }
\ No newline at end of file